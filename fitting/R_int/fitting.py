@@ -35,14 +35,19 @@ def perform_fitting(
     Returns:
         ModelResult: The result of the fitting process.
     """
-    valid = ~np.isnan(V_int) & ~np.isnan(I_int)
-    I_valid = I_int[valid]
-    V_valid = V_int[valid]
+    valid = np.isfinite(V_int)
+    np.logical_and(valid, np.isfinite(I_int), out=valid)
+    if valid.all():
+        I_valid, V_valid = I_int, V_int
+    else:
+        I_valid, V_valid = I_int[valid], V_int[valid]
+    # Weights are fixed by the data; lmfit reuses this array on every residual
+    weights = np.square(V_valid)
     result = model.fit(
         V_valid,
         params,
         I_ints=I_valid,
-        weights=V_valid**2,
+        weights=weights,
         iter_cb=fit_callback,
         max_nfev=100,
     )
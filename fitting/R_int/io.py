@@ -2,13 +2,15 @@
 # coding: utf-8
 
 import logging
+from pathlib import Path
 
 import pandas as pd
 
 
 def load_data(file_path: str) -> pd.DataFrame:
     """
-    Load data from a text file into a Pandas DataFrame.
+    Load data from a text file into a Pandas DataFrame. Files ending in
+    .parquet are read as Parquet (requires pyarrow, the "parquet" extra).
 
     Parameters:
         file_path (str): Path to the data file.
@@ -17,7 +19,10 @@ def load_data(file_path: str) -> pd.DataFrame:
         pd.DataFrame: Loaded DataFrame.
     """
     try:
-        df = pd.read_table(file_path)
+        if Path(file_path).suffix == ".parquet":
+            df = pd.read_parquet(file_path)
+        else:
+            df = pd.read_table(file_path)
         logging.info("Data loaded successfully from %s.", file_path)
         logging.debug("DataFrame columns: %s", df.columns.tolist())
         return df
@@ -28,14 +33,18 @@ def load_data(file_path: str) -> pd.DataFrame:
 
 def save_processed_data(df: pd.DataFrame, file_path: str) -> None:
     """
-    Save the processed DataFrame to a text file.
+    Save the processed DataFrame to a text file, or to a binary Parquet file
+    if file_path ends in .parquet (requires pyarrow, the "parquet" extra).
 
     Parameters:
         df (pd.DataFrame): Processed DataFrame.
         file_path (str): Path to save the DataFrame.
     """
     try:
-        df.to_csv(file_path, sep="\t", index=True)
+        if Path(file_path).suffix == ".parquet":
+            df.to_parquet(file_path, compression="zstd", index=True)
+        else:
+            df.to_csv(file_path, sep="\t", index=True)
         logging.info("Processed data saved to %s.", file_path)
     except Exception:
         logging.exception("Error saving processed data to %s", file_path)
@@ -8,14 +8,12 @@ CLI entry point for R_int fitting analysis.
 import argparse
 import logging
 from argparse import Namespace
-from typing import Any, cast
 
 import lmfit as lf
-import numpy as np
 
 from fitting.R_int.fitting import perform_fitting
 from fitting.R_int.io import load_data, save_processed_data
-from fitting.R_int.model import P2T, T2R_th
+from fitting.R_int.model import V_int2T_R_th
 from fitting.R_int.plot import (
     plot_current_temperature,
     plot_current_thermal_resistance,
@@ -110,22 +108,16 @@ def main() -> None:
     V_cal = I_int2V_int(I_int, **result.best_values)
     plot_voltage_current(I_int, V_int, V_cal, output=args.output_plot)
 
-    P_cal = V_cal * I_int
-    T_cal = cast(
-        np.ndarray[Any, Any],
-        P2T(P_cal, result.best_values["gamma"], result.best_values["T_bath"]),
+    T_cal, R_th_cal = V_int2T_R_th(
+        I_int,
+        V_cal,
+        result.best_values["alpha"],
+        result.best_values["beta"],
+        result.best_values["gamma"],
+        result.best_values["T_bath"],
     )
     plot_current_temperature(I_int, T_cal, output=args.output_plot)
 
-    R_th_cal = cast(
-        np.ndarray[Any, Any],
-        T2R_th(
-            T_cal,
-            result.best_values["alpha"],
-            result.best_values["beta"],
-            result.best_values["gamma"],
-        ),
-    )
     plot_current_thermal_resistance(I_int, R_th_cal, result, output=args.output_plot)
 
 
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-from typing import Any, Union
+from typing import Any, Tuple, Union
 
 import numpy as np
 from numpy.typing import NDArray
@@ -13,7 +13,27 @@ def T2R_int(
     """
     Calculate thermal resistance from temperature.
     """
-    return A * (np.exp(-T / B) + np.exp(-(T**2) / C)) + D
+    if not isinstance(T, np.ndarray):
+        return A * (np.exp(-T / B) + np.exp(-(T**2) / C)) + D
+    # Evaluate in place to avoid allocating a temporary array per operation
+    R = np.divide(T, -B)
+    np.exp(R, out=R)
+    E = np.square(T, dtype=R.dtype)
+    np.divide(E, -C, out=E)
+    np.exp(E, out=E)
+    R += E
+    R *= A
+    R += D
+    return R
+
+
+def dT2R_int(
+    T: Union[float, NDArray[Any]], A: float, B: float, C: float, D: float
+) -> Union[float, NDArray[Any]]:
+    """
+    Derivative of T2R_int with respect to temperature.
+    """
+    return -A * (np.exp(-T / B) / B + 2 * T * np.exp(-(T**2) / C) / C)
 
 
 def P2T(
@@ -31,4 +51,35 @@ def T2R_th(
     """
     Calculate thermal resistance from temperature (alternative model).
     """
-    return gamma / (1 - alpha * np.exp(-beta * T))
+    if not isinstance(T, np.ndarray):
+        return gamma / (1 - alpha * np.exp(-beta * T))
+    # Evaluate in place to avoid allocating a temporary array per operation
+    R = np.multiply(T, -beta)
+    np.exp(R, out=R)
+    R *= alpha
+    np.subtract(1, R, out=R)
+    np.divide(gamma, R, out=R)
+    return R
+
+
+def V_int2T_R_th(
+    I_int: NDArray[Any],
+    V_int: NDArray[Any],
+    alpha: float,
+    beta: float,
+    gamma: float,
+    T_bath: float,
+) -> Tuple[NDArray[Any], NDArray[Any]]:
+    """
+    Calculate temperature and thermal resistance from a solved I-V curve.
+
+    The temperature follows P2T with R_th = gamma. Power is formed in the
+    temperature buffer, so only the two returned arrays are allocated.
+
+    Returns:
+        Tuple[NDArray, NDArray]: Temperature and thermal resistance arrays.
+    """
+    T = np.multiply(V_int, I_int)
+    T *= gamma
+    T += T_bath
+    return T, T2R_th(T, alpha, beta, gamma)
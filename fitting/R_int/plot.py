@@ -2,15 +2,49 @@
 # coding: utf-8
 
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
 
 from fitting.R_int.model import T2R_th
 
+# Resolution of rasterized scatter points in saved figures
+SAVEFIG_DPI = 150
 
-def plot_thermal_resistance(result, output: Optional[str] = None):
+
+def _get_axes(ax: Optional[Axes]) -> Tuple[Axes, bool]:
+    """
+    Return the axes to draw on and whether the figure was created here.
+    """
+    if ax is None:
+        _, ax = plt.subplots(figsize=(8, 6), layout="constrained")
+        return ax, True
+    return ax, False
+
+
+def _save_or_show(
+    ax: Axes, output: Optional[str], description: str, owned: bool
+) -> None:
+    """
+    Save the figure if an output path is given. Figures created by the plot
+    function are closed after saving, or shown when no output path is given;
+    figures passed in by the caller are left open.
+    """
+    fig = ax.figure
+    if output:
+        fig.savefig(output, dpi=SAVEFIG_DPI)
+        logging.info("%s plot saved to %s.", description, output)
+        if owned:
+            plt.close(fig)
+    elif owned:
+        plt.show()
+
+
+def plot_thermal_resistance(
+    result, output: Optional[str] = None, ax: Optional[Axes] = None
+):
     """
     Plot Thermal Resistance vs Temperature from fitting result.
     """
@@ -22,17 +56,13 @@ def plot_thermal_resistance(result, output: Optional[str] = None):
         result.best_values["gamma"],
     )
 
-    plt.figure(figsize=(8, 6))
-    plt.plot(T, R_th, label="Thermal Resistance Model")
-    plt.grid(True, linestyle="--", linewidth=0.5)
-    plt.ylabel("Thermal Resistance [K/W]")
-    plt.xlabel("Temperature [K]")
-    plt.legend()
-    plt.tight_layout()
-    if output:
-        plt.savefig(output)
-        logging.info(f"Thermal resistance plot saved to {output}.")
-    plt.show()
+    ax, owned = _get_axes(ax)
+    ax.plot(T, R_th, label="Thermal Resistance Model")
+    ax.grid(True, linestyle="--", linewidth=0.5)
+    ax.set_ylabel("Thermal Resistance [K/W]")
+    ax.set_xlabel("Temperature [K]")
+    ax.legend()
+    _save_or_show(ax, output, "Thermal resistance", owned)
 
 
 def plot_voltage_current(
@@ -40,58 +70,56 @@ def plot_voltage_current(
     V_int_exp: np.ndarray,
     V_int_calc: np.ndarray,
     output: Optional[str] = None,
+    ax: Optional[Axes] = None,
 ):
     """
     Plot Experimental and Calculated Voltage vs Current.
     """
-    plt.figure(figsize=(8, 6))
-    plt.scatter(I_int * 1e3, V_int_exp, label="Experimental", s=5)
-    plt.scatter(I_int * 1e3, V_int_calc, label="Calculated", s=5)
-    plt.grid(True, linestyle="--", linewidth=0.5)
-    plt.ylabel("Voltage [V]")
-    plt.xlabel("Current [mA]")
-    plt.legend()
-    plt.tight_layout()
-    if output:
-        plt.savefig(output)
-        logging.info(f"Voltage vs current plot saved to {output}.")
-    plt.show()
+    ax, owned = _get_axes(ax)
+    ax.scatter(I_int * 1e3, V_int_exp, label="Experimental", s=5, rasterized=True)
+    ax.scatter(I_int * 1e3, V_int_calc, label="Calculated", s=5, rasterized=True)
+    ax.grid(True, linestyle="--", linewidth=0.5)
+    ax.set_ylabel("Voltage [V]")
+    ax.set_xlabel("Current [mA]")
+    ax.legend()
+    _save_or_show(ax, output, "Voltage vs current", owned)
 
 
 def plot_current_temperature(
-    I_int: np.ndarray, T_cal: np.ndarray, output: Optional[str] = None
+    I_int: np.ndarray,
+    T_cal: np.ndarray,
+    output: Optional[str] = None,
+    ax: Optional[Axes] = None,
 ):
     """
     Plot Temperature vs Current.
     """
-    plt.figure(figsize=(8, 6))
-    plt.scatter(I_int, T_cal, s=5)
-    plt.grid(True, linestyle="--", linewidth=0.5)
-    plt.ylabel("Temperature [K]")
-    plt.xlabel("Current [A]")
-    plt.tight_layout()
+    ax, owned = _get_axes(ax)
+    ax.scatter(I_int, T_cal, s=5, rasterized=True)
+    ax.grid(True, linestyle="--", linewidth=0.5)
+    ax.set_ylabel("Temperature [K]")
+    ax.set_xlabel("Current [A]")
     if output:
-        out = output.replace(".pdf", "_Temperature_vs_Current.pdf")
-        plt.savefig(out)
-        logging.info(f"Temperature vs current plot saved to {out}.")
-    plt.show()
+        output = output.replace(".pdf", "_Temperature_vs_Current.pdf")
+    _save_or_show(ax, output, "Temperature vs current", owned)
 
 
 def plot_current_thermal_resistance(
-    I_int: np.ndarray, R_th_cal: np.ndarray, result, output: Optional[str] = None
+    I_int: np.ndarray,
+    R_th_cal: np.ndarray,
+    result,
+    output: Optional[str] = None,
+    ax: Optional[Axes] = None,
 ):
     """
     Plot Thermal Resistance vs Current.
     """
-    plt.figure(figsize=(8, 6))
-    plt.scatter(I_int, R_th_cal, s=5)
-    plt.grid(True, linestyle="--", linewidth=0.5)
-    plt.ylabel("Thermal Resistance [K/W]")
-    plt.xlabel("Current [A]")
-    plt.ylim(0, result.best_values["gamma"] * 10)
-    plt.tight_layout()
+    ax, owned = _get_axes(ax)
+    ax.scatter(I_int, R_th_cal, s=5, rasterized=True)
+    ax.grid(True, linestyle="--", linewidth=0.5)
+    ax.set_ylabel("Thermal Resistance [K/W]")
+    ax.set_xlabel("Current [A]")
+    ax.set_ylim(0, result.best_values["gamma"] * 10)
     if output:
-        out = output.replace(".pdf", "_Thermal_Resistance_vs_Current.pdf")
-        plt.savefig(out)
-        logging.info(f"Thermal resistance vs current plot saved to {out}.")
-    plt.show()
+        output = output.replace(".pdf", "_Thermal_Resistance_vs_Current.pdf")
+    _save_or_show(ax, output, "Thermal resistance vs current", owned)
@@ -3,6 +3,7 @@
 
 import logging
 
+import numpy as np
 import pandas as pd
 
 
@@ -16,19 +17,19 @@ def process_data(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Processed DataFrame with 'Power' and 'Resistance' columns.
     """
-    df_processed = df.copy()
-
-    if "Reduced Voltage" in df_processed.columns and "Current" in df_processed.columns:
-        df_processed["Power"] = (
-            df_processed["Reduced Voltage"] * df_processed["Current"] * 1e-3
-        )
-        df_processed["Resistance"] = (
-            df_processed["Reduced Voltage"] / df_processed["Current"] * 1e3
-        )
+    if "Reduced Voltage" in df.columns and "Current" in df.columns:
+        voltage = df["Reduced Voltage"].to_numpy()
+        current = df["Current"].to_numpy()
+        # Zero current gives an infinite resistance, as with Series division
+        with np.errstate(divide="ignore", invalid="ignore"):
+            df_processed = df.assign(
+                Power=voltage * current * 1e-3,
+                Resistance=voltage / current * 1e3,
+            )
         logging.info("Calculated 'Power' and 'Resistance' columns.")
     else:
-        missing = {"Reduced Voltage", "Current"} - set(df_processed.columns)
-        logging.error(f"Missing columns for processing: {missing}")
+        missing = {"Reduced Voltage", "Current"} - set(df.columns)
+        logging.error("Missing columns for processing: %s", missing)
         raise KeyError(f"Missing columns: {missing}")
 
     return df_processed
@@ -2,28 +2,121 @@
 # coding: utf-8
 
 import logging
-from typing import cast
+from typing import Any, Callable, Optional, Tuple, Union
 
 import numpy as np
-from scipy.optimize import root  # type: ignore
+from numpy.typing import NDArray
 
-from fitting.R_int.model import P2T, T2R_int, T2R_th
+from fitting.R_int.model import P2T, T2R_int, T2R_th, dT2R_int
+
+# Lowest starting temperature of the Newton temperature solve
+T_INIT = 30.0
+# Absolute and relative tolerances of the vectorized root finders
+XTOL = 1e-15
+RTOL = 4 * np.finfo(float).eps
+# Relative residual accepted for a V_int root
+FTOL = 1e-8
+# Relative step tolerance of the Newton temperature solve
+T_RTOL = 1e-12
+MAXITER = 100
+# Maximum number of bracket doublings for the V_int solve
+MAXEXPAND = 60
+
+# Last (I_ints, V_int) solution, used to warm-start the next solve on the
+# same currents (lmfit evaluates the model repeatedly with nearby parameters)
+_last_solution: Optional[Tuple[NDArray[Any], NDArray[Any]]] = None
 
 
 def solve4T(
-    T: float, P: float, alpha: float, beta: float, gamma: float, T_bath: float
-) -> float:
+    T: Union[float, NDArray[Any]],
+    P: Union[float, NDArray[Any]],
+    alpha: float,
+    beta: float,
+    gamma: float,
+    T_bath: float,
+) -> Union[float, NDArray[Any]]:
     """
     Solve for temperature residual given power and parameters.
     """
-    R_th = cast(float, T2R_th(T, alpha, beta, gamma))
-    T_calc = cast(float, P2T(P, R_th, T_bath))
+    R_th = T2R_th(T, alpha, beta, gamma)
+    T_calc = P2T(P, R_th, T_bath)
     return T - T_calc
 
 
+def dsolve4T(
+    T: Union[float, NDArray[Any]],
+    P: Union[float, NDArray[Any]],
+    alpha: float,
+    beta: float,
+    gamma: float,
+) -> Union[float, NDArray[Any]]:
+    """
+    Derivative of the temperature residual with respect to T.
+    """
+    exp_bT = np.exp(-beta * T)
+    return 1 + gamma * P * alpha * beta * exp_bT / (1 - alpha * exp_bT) ** 2
+
+
+def solve_T(
+    P: NDArray[Any], alpha: float, beta: float, gamma: float, T_bath: float
+) -> NDArray[Any]:
+    """
+    Solve the temperature for every power sample.
+
+    For alpha == 0 the thermal resistance is constant and T = gamma * P +
+    T_bath. Otherwise a vectorized Newton iteration is started from that
+    solution (but not below T_INIT). For alpha > 0, R_th has a pole at
+    T = ln(alpha) / beta and is negative below it, so every sample is kept
+    in a bracket strictly above the pole: a step that leaves the bracket
+    falls back to bisection, like _newton. Only samples that have not
+    converged yet are iterated; samples that do not converge, or whose root
+    has 1 - alpha * exp(-beta * T) <= 0, are returned as NaN. Samples with
+    zero power are at T_bath whatever R_th is.
+    """
+    T0 = P2T(P, gamma, T_bath)
+    if alpha == 0:
+        return T0
+    T = np.where(P == 0, T_bath, np.nan)
+    active = np.flatnonzero(np.isfinite(P) & (P != 0))
+    P_a = P[active]
+    # The residual is increasing for P > 0, with f(lo) < 0 < f(hi)
+    T_pole = np.log(alpha) / beta if alpha > 0 else -np.inf
+    lo = np.full(active.size, T_pole)
+    hi = np.full(active.size, np.inf)
+    T_a = np.maximum(T0[active], T_INIT)
+    if alpha > 0:
+        T_a = np.where(T_a > T_pole, T_a, T_pole + np.maximum(1.0, abs(T_pole)))
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        for _ in range(MAXITER):
+            if active.size == 0:
+                break
+            # Share exp(-beta * T) between the residual and its derivative
+            exp_bT = np.exp(-beta * T_a)
+            denom = 1 - alpha * exp_bT
+            residual = T_a - P2T(P_a, gamma / denom, T_bath)
+            lo = np.where(residual < 0, T_a, lo)
+            hi = np.where(residual > 0, T_a, hi)
+            step = residual / (1 + gamma * P_a * alpha * beta * exp_bT / denom**2)
+            T_new = T_a - step
+            # Bisect when the step leaves the bracket; with no upper bound
+            # yet, halve the distance to the lower bound instead
+            outside = ~((T_new - lo) * (T_new - hi) < 0)
+            bisect = np.where(np.isfinite(hi), 0.5 * (lo + hi), 0.5 * (lo + T_a))
+            T_new = np.where(outside, bisect, T_new)
+            done = (residual == 0) | (np.abs(T_new - T_a) <= T_RTOL * (1 + np.abs(T_a)))
+            T_a = np.where(residual == 0, T_a, T_new)
+            T[active[done]] = T_a[done]
+            keep = ~done
+            active, T_a, P_a = active[keep], T_a[keep], P_a[keep]
+            lo, hi = lo[keep], hi[keep]
+        # Reject roots on the non-physical side of the pole
+        T[(P != 0) & ~(1 - alpha * np.exp(-beta * T) > 0)] = np.nan
+    return T
+
+
 def solve4V_int(
-    V_int: float,
-    I_int: float,
+    V_int: NDArray[Any],
+    I_int: NDArray[Any],
     A: float,
     B: float,
     C: float,
@@ -32,21 +125,96 @@ def solve4V_int(
     beta: float,
     gamma: float,
     T_bath: float,
-) -> float:
+) -> NDArray[Any]:
     """
     Function to solve for V_int given I_int and model parameters.
     """
     P = V_int * I_int
-    sol = root(fun=solve4T, x0=30.0, args=(P, alpha, beta, gamma, T_bath))
-    if not sol.success:
-        logging.warning(
-            f"Root finding did not converge for V_int={V_int}, I_int={I_int}."
-        )
-    T_val = sol.x[0]
-    R_int = cast(float, T2R_int(T_val, A, B, C, D))
+    T_val = solve_T(P, alpha, beta, gamma, T_bath)
+    R_int = T2R_int(T_val, A, B, C, D)
     return V_int - R_int * I_int
 
 
+def dsolve4V_int(
+    V_int: NDArray[Any],
+    I_int: NDArray[Any],
+    T: NDArray[Any],
+    A: float,
+    B: float,
+    C: float,
+    D: float,
+    alpha: float,
+    beta: float,
+    gamma: float,
+) -> NDArray[Any]:
+    """
+    Derivative of the V_int residual with respect to V_int, given the solved
+    temperature T.
+
+    dT/dP follows from implicit differentiation of solve4T: R_th / dsolve4T.
+    """
+    P = V_int * I_int
+    dT_dP = T2R_th(T, alpha, beta, gamma) / dsolve4T(T, P, alpha, beta, gamma)
+    return 1 - dT2R_int(T, A, B, C, D) * dT_dP * I_int**2
+
+
+def _newton(
+    fdf: Callable[[NDArray[Any], NDArray[Any]], Tuple[NDArray[Any], NDArray[Any]]],
+    a: NDArray[Any],
+    b: NDArray[Any],
+    fa: NDArray[Any],
+    fb: NDArray[Any],
+    x0: Optional[NDArray[Any]] = None,
+) -> Tuple[NDArray[Any], NDArray[Any]]:
+    """
+    Refine the brackets [a, b] of f element-wise with Newton's method started
+    from a, falling back to bisection whenever a step leaves the bracket.
+    Elements of x0 that lie strictly inside their bracket are used as the
+    starting point instead.
+
+    fdf(x, idx) returns f and its derivative for the elements idx at x; only
+    elements that have not converged yet are evaluated.
+
+    Returns:
+        Tuple[NDArray, NDArray]: Roots and mask of converged elements.
+    """
+    x = np.where(fb == 0, b, a)
+    converged = (fa == 0) | (fb == 0)
+    active = np.flatnonzero(~converged)
+    # Orient the brackets so that f(lo) < 0 < f(hi)
+    neg = fa[active] < 0
+    lo = np.where(neg, a[active], b[active])
+    hi = np.where(neg, b[active], a[active])
+    x_a = x[active]
+    if x0 is not None:
+        x0_a = x0[active]
+        inside = (x0_a - lo) * (x0_a - hi) < 0
+        x_a[inside] = x0_a[inside]
+        x[active] = x_a
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        f, df = fdf(x_a, active)
+        for _ in range(MAXITER):
+            step = f / df
+            tol = 2 * RTOL * np.abs(x_a) + XTOL
+            done = (f == 0) | (np.abs(step) <= tol) | (np.abs(hi - lo) <= 2 * tol)
+            converged[active[done]] = True
+
+            keep = ~done
+            active, x_a, step = active[keep], x_a[keep], step[keep]
+            lo, hi = lo[keep], hi[keep]
+            if active.size == 0:
+                break
+
+            x_a = x_a - step
+            outside = ~((x_a - lo) * (x_a - hi) < 0)
+            x_a = np.where(outside, 0.5 * (lo + hi), x_a)
+            x[active] = x_a
+            f, df = fdf(x_a, active)
+            lo = np.where(f < 0, x_a, lo)
+            hi = np.where(f > 0, x_a, hi)
+    return x, converged
+
+
 def I_int2V_int(
     I_ints: np.ndarray,
     A: float,
@@ -60,15 +228,60 @@ def I_int2V_int(
 ) -> np.ndarray:
     """
     Calculate V_int array from I_int array using root finding.
+
+    All current samples are solved at once: the root of solve4V_int is
+    bracketed between 0 and a voltage of the same sign as I_int, then
+    refined with a vectorized Newton iteration using the analytic
+    derivative dsolve4V_int. The iteration is warm-started from the previous
+    solution when it was computed for the same currents.
     """
-    V_int = np.empty_like(I_ints)
-    for i, I in enumerate(I_ints):
-        sol = root(
-            fun=solve4V_int, x0=20e-3, args=(I, A, B, C, D, alpha, beta, gamma, T_bath)
+    global _last_solution
+    I_ints = np.asarray(I_ints, dtype=float)
+    params = (A, B, C, D, alpha, beta, gamma, T_bath)
+
+    def f(V: NDArray[Any], idx: Union[slice, NDArray[Any]]) -> NDArray[Any]:
+        return solve4V_int(V, I_ints[idx], *params)
+
+    def fdf(V: NDArray[Any], idx: NDArray[Any]) -> Tuple[NDArray[Any], NDArray[Any]]:
+        I_int = I_ints[idx]
+        T = solve_T(V * I_int, alpha, beta, gamma, T_bath)
+        residual = V - T2R_int(T, A, B, C, D) * I_int
+        return residual, dsolve4V_int(V, I_int, T, *params[:7])
+
+    # Bracket the root: f(0) = -R_int(T_bath) * I_int, so start the upper end
+    # at R_int(T_bath) * I_int and double it until the sign changes.
+    all_samples = slice(None)
+    a = np.zeros_like(I_ints)
+    fa = f(a, all_samples)
+    b = -fa
+    fb = f(b, all_samples)
+    with np.errstate(over="ignore", invalid="ignore"):
+        for _ in range(MAXEXPAND):
+            grow = np.flatnonzero(
+                (np.sign(fb) == np.sign(fa)) & (fa != 0) & np.isfinite(fb)
+            )
+            if grow.size == 0:
+                break
+            b[grow] *= 2
+            fb[grow] = f(b[grow], grow)
+    bracketed = (np.sign(fa) != np.sign(fb)) & np.isfinite(fa) & np.isfinite(fb)
+    bracketed |= fa == 0
+
+    x0 = None
+    if _last_solution is not None and np.array_equal(_last_solution[0], I_ints):
+        x0 = _last_solution[1]
+    V_int, converged = _newton(fdf, a, b, fa, fb, x0)
+    # Reject sign changes across a failed or discontinuous temperature solve
+    with np.errstate(invalid="ignore"):
+        converged &= bracketed & (
+            np.abs(f(V_int, all_samples)) <= FTOL * np.abs(V_int) + XTOL
+        )
+    if not converged.all():
+        logging.warning(
+            "Root finding did not converge for %d of %d I_int samples.",
+            np.count_nonzero(~converged),
+            converged.size,
         )
-        if sol.success:
-            V_int[i] = sol.x[0]
-        else:
-            logging.warning(f"Root finding did not converge for I_int={I}.")
-            V_int[i] = np.nan
+    V_int = np.where(converged, V_int, np.nan)
+    _last_solution = (I_ints.copy(), V_int)
     return V_int
@@ -2,10 +2,16 @@
 # coding: utf-8
 
 import logging
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Sequence, Union
 
 import lmfit as lf  # type: ignore
 import numpy as np
 from lmfit.model import ModelResult  # type: ignore
+from scipy.optimize import OptimizeResult, least_squares
+
+# Relative finite-difference step for parameters without analytic derivatives
+FD_STEP = np.sqrt(np.finfo(float).eps)
 
 
 def setup_fitting_model(output_power_fn) -> lf.Model:
@@ -45,3 +51,142 @@ def perform_fitting(
     logging.info(result.fit_report())
     logging.info("Best fit values: %s", result.best_values)
     return result
+
+
+def perform_batched_least_squares(
+    model_fn: Callable[..., np.ndarray],
+    par_val: Dict[str, Any],
+    par_min: Dict[str, float],
+    par_max: Dict[str, float],
+    par_vary: Dict[str, bool],
+    datasets: Sequence[Dict[str, np.ndarray]],
+    jac_fn: Optional[Callable[..., Dict[str, np.ndarray]]] = None,
+) -> OptimizeResult:
+    """
+    Fit model_fn with scipy.optimize.least_squares on a plain parameter
+    vector, jointly to one or more datasets in a single call by
+    concatenating their weighted residuals.
+
+    Only the parameters marked in par_vary are optimized; the others are
+    passed to model_fn unchanged. The residual of each dataset is
+    weights * (model - data), the same weighting lmfit applies. If jac_fn is
+    given, it is called like model_fn and returns the model derivatives
+    keyed by parameter name; free parameters it does not return are
+    differentiated by forward differences. Without jac_fn the whole
+    Jacobian is taken by finite differences.
+
+    Parameters:
+        model_fn (Callable): Model function called as model_fn(V=..., R_int=..., **params).
+        par_val (Dict[str, Any]): Initial parameter values.
+        par_min (Dict[str, float]): Lower bounds.
+        par_max (Dict[str, float]): Upper bounds.
+        par_vary (Dict[str, bool]): Whether each parameter is optimized.
+        datasets (Sequence[Dict[str, np.ndarray]]): Datasets with keys "V"
+            (voltage array), "R_int" (internal resistance array), "data"
+            (dependent variable data to fit) and "weights".
+        jac_fn (Callable, optional): Analytic model derivatives.
+
+    Returns:
+        OptimizeResult: The least_squares result, with the full parameter
+        dictionary added as best_values, the covariance of the free
+        parameters as covar (None if it cannot be estimated), and their
+        standard errors as stderr.
+    """
+    free_names = [name for name in par_val if par_vary[name]]
+    fixed = {name: value for name, value in par_val.items() if not par_vary[name]}
+    x0 = np.array([par_val[name] for name in free_names], dtype=float)
+    lb = np.array([par_min[name] for name in free_names], dtype=float)
+    ub = np.array([par_max[name] for name in free_names], dtype=float)
+
+    # Bind the data and fixed parameters once, outside the residual loop
+    models = [
+        partial(model_fn, V=ds["V"], R_int=ds["R_int"], **fixed) for ds in datasets
+    ]
+
+    # Offsets of each dataset in the stacked residual vector
+    offsets = np.cumsum([0] + [len(ds["data"]) for ds in datasets])
+
+    def residuals(x: np.ndarray) -> np.ndarray:
+        free = dict(zip(free_names, x))
+        # Subtract and weight in place in each slice of one fresh output
+        # array (least_squares keeps the previous residual vector)
+        res = np.empty(offsets[-1])
+        for model, ds, lo, hi in zip(models, datasets, offsets[:-1], offsets[1:]):
+            out = res[lo:hi]
+            np.subtract(model(**free), ds["data"], out=out)
+            np.multiply(out, ds["weights"], out=out)
+        return res
+
+    jac: Union[str, Callable[[np.ndarray], np.ndarray]] = "2-point"
+    if jac_fn is not None:
+        model_jacs = [
+            partial(jac_fn, V=ds["V"], R_int=ds["R_int"], **fixed) for ds in datasets
+        ]
+
+        def analytic_jac(x: np.ndarray) -> np.ndarray:
+            free = dict(zip(free_names, x))
+            blocks = []
+            for model, model_jac, ds in zip(models, model_jacs, datasets):
+                derivs = model_jac(**free)
+                missing = [name for name in free_names if name not in derivs]
+                if missing:
+                    # Forward differences for the free parameters jac_fn does
+                    # not cover, stepping away from the upper bound
+                    base = model(**free)
+                    for name in missing:
+                        value = free[name]
+                        h = FD_STEP * max(1.0, abs(value))
+                        if value + h > ub[free_names.index(name)]:
+                            h = -h
+                        derivs[name] = (model(**{**free, name: value + h}) - base) / h
+                blocks.append(
+                    np.column_stack([derivs[name] for name in free_names])
+                    * ds["weights"][:, None]
+                )
+            return np.vstack(blocks)
+
+        jac = analytic_jac
+
+    # Scale the steps by the initial values (R, L and C differ by ~1e6), and
+    # disable gtol: it is an absolute test that the tiny weighted residuals
+    # pass at the first iteration, so terminate on the relative ftol/xtol
+    x_scale = np.where(x0 != 0, np.abs(x0), 1.0)
+    result = least_squares(
+        residuals,
+        x0,
+        jac=jac,
+        bounds=(lb, ub),
+        method="trf",
+        x_scale=x_scale,
+        gtol=None,
+    )
+    free = dict(zip(free_names, result.x.tolist()))
+    result.best_values = {
+        name: free.get(name, value) for name, value in par_val.items()
+    }
+
+    # Covariance of the free parameters from the Jacobian at the solution,
+    # scaled by the reduced chi-square as lmfit does
+    n_data, n_free = result.jac.shape
+    result.covar = None
+    if n_data > n_free:
+        try:
+            jtj = result.jac.T @ result.jac
+            result.covar = np.linalg.inv(jtj) * 2 * result.cost / (n_data - n_free)
+        except np.linalg.LinAlgError:
+            logging.warning("Singular Jacobian; standard errors are not available.")
+    result.stderr = (
+        dict(zip(free_names, np.sqrt(np.diag(result.covar)).tolist()))
+        if result.covar is not None
+        else {}
+    )
+    logging.info(
+        "Fitting of %d dataset(s) completed: %s (nfev=%d, cost=%g).",
+        len(datasets),
+        result.message,
+        result.nfev,
+        result.cost,
+    )
+    logging.info("Best fit values: %s", result.best_values)
+    logging.info("Standard errors: %s", result.stderr)
+    return result
@@ -6,6 +6,23 @@ from typing import Tuple
 
 import pandas as pd
 
+# Known numeric columns of the Bolometer Output and IVE tables; pinning their
+# dtype skips type inference (columns absent from a file are ignored)
+FLOAT_COLUMNS = {
+    "Resistance": "float64",
+    "Bolometer Output": "float64",
+    "Reduced Voltage": "float64",
+    "Current": "float64",
+    "Bolometer Detection": "float64",
+}
+
+
+def _read_table(file_path: str) -> pd.DataFrame:
+    """
+    Read a tab-delimited data table with the C parser in a single pass.
+    """
+    return pd.read_table(file_path, engine="c", low_memory=False, dtype=FLOAT_COLUMNS)
+
 
 def load_data(
     bo_file_path: str,
@@ -22,12 +39,31 @@ def load_data(
         Tuple[pd.DataFrame, pd.DataFrame]: DataFrames containing Bolometer Output and IVE data.
     """
     try:
-        bolometer_df = pd.read_table(bo_file_path)
-        ive_df = pd.read_table(ive_file_path)
+        bolometer_df = _read_table(bo_file_path)
+        ive_df = _read_table(ive_file_path)
         logging.info("Experimental data loaded successfully.")
         return bolometer_df, ive_df
     except Exception as e:
-        logging.error(f"Error loading experimental data: {e}")
+        logging.error("Error loading experimental data: %s", e)
+        raise
+
+
+def load_bolometer_data(bo_file_path: str) -> pd.DataFrame:
+    """
+    Load an additional Bolometer Output data file for a joint fit.
+
+    Parameters:
+        bo_file_path (str): Path to the Bolometer Output data file.
+
+    Returns:
+        pd.DataFrame: DataFrame containing the Bolometer Output data.
+    """
+    try:
+        bolometer_df = _read_table(bo_file_path)
+        logging.info("Bolometer data loaded successfully from %s.", bo_file_path)
+        return bolometer_df
+    except Exception as e:
+        logging.error("Error loading bolometer data: %s", e)
         raise
 
 
@@ -42,9 +78,9 @@ def load_txt_data(filename: str) -> pd.DataFrame:
         pd.DataFrame: DataFrame containing the loaded data.
     """
     try:
-        df = pd.read_csv(filename, delim_whitespace=True)
-        logging.info(f"Text data loaded successfully from {filename}.")
+        df = pd.read_csv(filename, sep=r"\s+")
+        logging.info("Text data loaded successfully from %s.", filename)
         return df
     except Exception as e:
-        logging.error(f"Error loading text data: {e}")
+        logging.error("Error loading text data: %s", e)
         raise
@@ -74,19 +74,19 @@ def main():
     par_val = {
         "ratio": 1,
         "R": 55.04,
-        "L": 3.27e-10 * constants.e * 2 / constants.hbar / 808,
-        "C": 2.748e-16 * constants.e * 2 / constants.hbar / 808,
-        "C_intt": 4.339e-11 * constants.e * 2 / constants.hbar / 808,
-        "C_intb": 3.222e-12 * constants.e * 2 / constants.hbar / 808,
+        "L": 3.27e-10 * GAMMA,
+        "C": 2.748e-16 * GAMMA,
+        "C_intt": 4.339e-11 * GAMMA,
+        "C_intb": 3.222e-12 * GAMMA,
         "R_loss_t": 0.202,
         "R_loss_b": 2.922,
         "Ic": 18e-3,
         "R_ext": 1.15,
-        "L_ext": 10e-9 * constants.e * 2 / constants.hbar / 808,
+        "L_ext": 10e-9 * GAMMA,
         "R_gnd": 7.20,
         "R_mid": 8.29,
         "R_FG": 50,
-        "L_FG": 10e-9 * constants.e * 2 / constants.hbar / 808,
+        "L_FG": 10e-9 * GAMMA,
         "N": 848,
         "L_int_t": args.L_int_t,
         "L_int_b": args.L_int_b,
@@ -48,14 +48,12 @@ def parallel_sum(*impedances: complex | np.ndarray) -> np.ndarray:
     Returns:
         np.ndarray: Total parallel impedance.
     """
-    susceptances = [1 / z for z in impedances]
-    total_susceptance = sum(susceptances)
-
-    # Handle division by zero with small epsilon
-    epsilon = 1e-20
-    safe_susceptance = np.where(total_susceptance != 0, total_susceptance, epsilon)
-    Z_tot = 1.0 / safe_susceptance
-    Z_tot = np.where(total_susceptance != 0, Z_tot, np.inf)
+    # Accumulate the susceptances pairwise, without sum()'s extra 0 + first add
+    total_susceptance = np.asarray(series_sum(*(1 / z for z in impedances)))
+
+    # Zero total susceptance is an open circuit; divide only where it is nonzero
+    Z_tot = np.full_like(total_susceptance, np.inf)
+    np.divide(1.0, total_susceptance, out=Z_tot, where=total_susceptance != 0)
 
     return Z_tot
 
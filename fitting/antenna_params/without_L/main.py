@@ -10,16 +10,19 @@ import logging
 
 import numpy as np
 
-from ..utils.fitting import perform_fitting, setup_fitting_model
-from ..utils.io import load_data, load_txt_data
+from ..utils.fitting import perform_batched_least_squares
+from ..utils.io import load_bolometer_data, load_data, load_txt_data
 from ..utils.plot import plot_complex_figure, plot_fitting_results, plot_txt_data
-from .model import constants, output_power
+from .model import GAMMA, constants, output_power, output_power_jac
 
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Antenna parameter fitting analysis")
     parser.add_argument(
-        "--bo-file", required=True, help="Path to Bolometer Output data file"
+        "--bo-file",
+        required=True,
+        nargs="+",
+        help="Path to Bolometer Output data file; several files are fitted jointly",
     )
     parser.add_argument("--ive-file", required=True, help="Path to IVE data file")
     parser.add_argument("--txt-file", required=True, help="Path to text data file")
@@ -47,7 +50,7 @@ def main():
     args = parse_args()
 
     # Load experimental data
-    bolometer_df, ive_df = load_data(args.bo_file, args.ive_file)
+    bolometer_df, ive_df = load_data(args.bo_file[0], args.ive_file)
     R_int = bolometer_df["Resistance"].to_numpy()
     BO_exp = bolometer_df["Bolometer Output"].to_numpy() * 1e-3
     V = bolometer_df["Reduced Voltage"].to_numpy()
@@ -62,19 +65,19 @@ def main():
     par_val = {
         "ratio": 1,
         "R": 55.04,
-        "L": 3.27e-10 * constants.e * 2 / constants.hbar / 808,
-        "C": 2.748e-16 * constants.e * 2 / constants.hbar / 808,
-        "C_intt": 4.339e-11 * constants.e * 2 / constants.hbar / 808,
-        "C_intb": 3.222e-12 * constants.e * 2 / constants.hbar / 808,
+        "L": 3.27e-10 * GAMMA,
+        "C": 2.748e-16 * GAMMA,
+        "C_intt": 4.339e-11 * GAMMA,
+        "C_intb": 3.222e-12 * GAMMA,
         "R_loss_t": 0.202,
         "R_loss_b": 2.922,
         "Ic": 18e-3,
         "R_ext": 1.15,
-        "L_ext": 10e-9 * constants.e * 2 / constants.hbar / 808,
+        "L_ext": 10e-9 * GAMMA,
         "R_gnd": 7.20,
         "R_mid": 8.29,
         "R_FG": 50,
-        "L_FG": 10e-9 * constants.e * 2 / constants.hbar / 808,
+        "L_FG": 10e-9 * GAMMA,
         "N": 848,
     }
     par_min = {key: 0.0 for key in par_val}
@@ -99,25 +102,29 @@ def main():
         "N": False,
     }
 
-    # Setup and perform fitting
-    model = setup_fitting_model(output_power)
-    params = model.make_params()
-    for name in model.param_names:
-        params[name].set(
-            value=par_val[name],
-            min=par_min[name],
-            max=par_max[name],
-            vary=par_vary[name],
+    # Perform fitting, jointly over all bolometer files
+    sb_scale = args.epsilon_fit / constants.Sb
+    sb_scaled = BO_exp * sb_scale
+    datasets = [{"V": V, "R_int": R_int, "data": sb_scaled, "weights": BO_exp}]
+    for bo_file in args.bo_file[1:]:
+        extra_df = load_bolometer_data(bo_file)
+        BO_extra = extra_df["Bolometer Output"].to_numpy() * 1e-3
+        datasets.append(
+            {
+                "V": extra_df["Reduced Voltage"].to_numpy(),
+                "R_int": extra_df["Resistance"].to_numpy(),
+                "data": BO_extra * sb_scale,
+                "weights": BO_extra,
+            }
         )
-
-    sb_scaled = BO_exp / constants.Sb * args.epsilon_fit
-    result = perform_fitting(
-        model=model,
-        params=params,
-        V=V,
-        R_int=R_int,
-        data=sb_scaled,
-        weights=BO_exp,
+    result = perform_batched_least_squares(
+        output_power,
+        par_val,
+        par_min,
+        par_max,
+        par_vary,
+        datasets,
+        jac_fn=output_power_jac,
     )
 
     # Calculate and plot fitting results
@@ -171,7 +178,7 @@ def main():
     )
     plot_fitting_results(
         V=V_macro,
-        BO_exp_scaled=BO_macro / constants.Sb * args.epsilon_fit,
+        BO_exp_scaled=BO_macro * sb_scale,
         RP_cal=RP_cal_macro,
         fig_path=args.fig6,
     )
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-from typing import Tuple
+from typing import Dict, Tuple
 
 import numpy as np
 
@@ -48,14 +48,12 @@ def parallel_sum(*impedances: complex | np.ndarray) -> np.ndarray:
     Returns:
         np.ndarray: Total parallel impedance.
     """
-    susceptances = [1 / z for z in impedances]
-    total_susceptance = sum(susceptances)
+    # Accumulate the susceptances pairwise, without sum()'s extra 0 + first add
+    total_susceptance = np.asarray(series_sum(*(1 / z for z in impedances)))
 
-    # Handle division by zero with small epsilon
-    epsilon = 1e-20
-    safe_susceptance = np.where(total_susceptance != 0, total_susceptance, epsilon)
-    Z_tot = 1.0 / safe_susceptance
-    Z_tot = np.where(total_susceptance != 0, Z_tot, np.inf)
+    # Zero total susceptance is an open circuit; divide only where it is nonzero
+    Z_tot = np.full_like(total_susceptance, np.inf)
+    np.divide(1.0, total_susceptance, out=Z_tot, where=total_susceptance != 0)
 
     return Z_tot
 
@@ -152,3 +150,66 @@ def output_power(
     I_res = parallel_sum(Z_out, Z_res) * I_ext / Z_res
     power = R * np.abs(I_res) ** 2 / 2
     return ratio * power
+
+
+def output_power_jac(
+    V: np.ndarray,
+    R_int: np.ndarray,
+    ratio: float,
+    R: float,
+    L: float,
+    C: float,
+    C_intt: float,
+    C_intb: float,
+    R_loss_t: float,
+    R_loss_b: float,
+    Ic: float,
+    R_ext: float,
+    L_ext: float,
+    R_gnd: float,
+    R_mid: float,
+    R_FG: float,
+    L_FG: float,
+    N: int,
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate the derivatives of output_power with respect to R, L and C.
+
+    Eliminating the parallel and series sums gives
+    I_res = Z_out * Z_bottom * Ic / D with
+    D = (Z_out + Z_res) * (Z_bottom + Z_top) + Z_out * Z_res, so
+    dI_res/dZ_res = -I_res * (Z_out + Z_bottom + Z_top) / D. Only Z_res
+    depends on R, L and C.
+
+    Returns:
+        Dict[str, np.ndarray]: Derivatives keyed by parameter name.
+    """
+    Z_C, Z_res, Z_top, Z_bottom, Z_out, Z_tot = mesa_impedance(
+        V,
+        R_int,
+        R,
+        L,
+        C,
+        C_intt,
+        C_intb,
+        R_loss_t,
+        R_loss_b,
+        R_ext,
+        L_ext,
+        R_gnd,
+        R_mid,
+        R_FG,
+        L_FG,
+        N,
+    )
+    V_bottom = VOLTAGE_RATIO * V
+    D = (Z_out + Z_res) * (Z_bottom + Z_top) + Z_out * Z_res
+    I_res = Z_out * Z_bottom * Ic / D
+    # d|I_res|^2/dZ_res, to be contracted with dZ_res/dp for real p
+    dI2 = 2 * np.conj(I_res) * (-I_res * (Z_out + Z_bottom + Z_top) / D)
+    scale = ratio * R / 2
+    return {
+        "R": ratio * np.abs(I_res) ** 2 / 2 + scale * dI2.real,
+        "L": scale * (dI2 * 1j * V_bottom).real,
+        "C": scale * (dI2 * 1j / (V_bottom * C**2)).real,
+    }
@@ -7,12 +7,15 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 
+import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from matplotlib.figure import Figure
+from pandas.io.parsers import TextFileReader
+from pandas.tseries.frequencies import to_offset
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +29,19 @@ MATH_DEFAULT = "it"
 FONT_SIZE = 15
 R_RAD = 20  # Resistance value for power calculation
 
+# Columns process_data needs from the simulation output
+REQUIRED_COLUMNS = ["time", "V(nphase1)", "V(nphase2)", "I(Rrad)"]
+
+# Rows per chunk when streaming the input file
+CHUNK_SIZE = 1_000_000
+
+# Set once the matplotlib rcParams above have been applied
+_plotting_configured = False
+
+# Time conversion factors for binning
+NS_PER_S = 10**9
+NS_PER_DAY = 86_400 * NS_PER_S
+
 # File Paths
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
@@ -37,24 +53,39 @@ FILENAME_OUT = BASE_DIR / "dc_sweep_JPE_phase_processed.txt"
 PLOT_PATH = PLOTS_DIR / "dc_sweep_JPE_phase.pdf"
 
 
-def load_data(file_path: str) -> pd.DataFrame:
+def load_data(
+    file_path: str,
+    chunksize: Optional[int] = None,
+    usecols: Optional[List[str]] = None,
+) -> Union[pd.DataFrame, TextFileReader]:
     """
     Load data from a whitespace-delimited text file into a Pandas DataFrame.
 
     Parameters:
         file_path (str): Path to the input text file.
+        chunksize (Optional[int]): If given, return a reader over DataFrames
+            of this many rows instead of reading the whole file. The file is
+            parsed while iterating; close the reader, or use it in a with
+            statement, when done.
+        usecols (Optional[List[str]]): If given, only these columns are parsed.
 
     Returns:
-        pd.DataFrame: Loaded DataFrame.
+        Union[pd.DataFrame, TextFileReader]: Loaded DataFrame, or a reader
+        over its chunks.
 
     Raises:
         FileNotFoundError: If the file does not exist.
         pd.errors.ParserError: If there's an error parsing the file.
     """
     try:
-        df = pd.read_csv(file_path, sep=r"\s+")  # type: ignore[call-overload]
-        logging.info("Data loaded successfully from %s.", file_path)
-        logging.debug("DataFrame columns: %s", df.columns.tolist())
+        df = pd.read_csv(  # type: ignore[call-overload]
+            file_path, sep=r"\s+", chunksize=chunksize, usecols=usecols
+        )
+        if chunksize is None:
+            logging.info("Data loaded successfully from %s.", file_path)
+            logging.debug("DataFrame columns: %s", df.columns.tolist())
+        else:
+            logging.info("Streaming %s in chunks of %d rows.", file_path, chunksize)
         return df
     except FileNotFoundError:
         logging.error("File not found: %s", file_path)
@@ -67,65 +98,189 @@ def load_data(file_path: str) -> pd.DataFrame:
         raise
 
 
-def process_data(df: pd.DataFrame, resample_interval: str = "100us") -> pd.DataFrame:
+def _seconds_to_ns(t: np.ndarray) -> np.ndarray:
     """
-    Process the DataFrame by computing phase differences, power, and resampling.
+    Convert float seconds to integer nanoseconds, rounding the fractional
+    part the same way as pd.to_datetime(t, unit="s").
+    """
+    base = t.astype(np.int64)
+    frac = np.round(t - base, 9)
+    return base * NS_PER_S + (frac * NS_PER_S).astype(np.int64)
+
+
+def _process_chunk(
+    df: pd.DataFrame, previous: Optional[pd.Series] = None
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Compute phase differences and power for one chunk.
 
     Parameters:
-        df (pd.DataFrame): Original DataFrame.
-        resample_interval (str): Resample interval for data (pandas offset alias).
+        df (pd.DataFrame): Chunk of the original DataFrame.
+        previous (Optional[pd.Series]): Last row of the previous chunk, used for
+            the first phase difference of this chunk.
 
     Returns:
-        pd.DataFrame: Processed and resampled DataFrame.
+        Tuple[np.ndarray, Dict[str, np.ndarray]]: Time in nanoseconds and the
+        processed columns, for the rows with a finite time.
 
     Raises:
         KeyError: If required columns are missing.
     """
-    df_processed = df.copy()
-
     # Verify required columns
-    required_columns = ["time", "V(nphase1)", "V(nphase2)", "I(Rrad)"]
-    missing_columns = [
-        col for col in required_columns if col not in df_processed.columns
-    ]
+    missing_columns = [col for col in REQUIRED_COLUMNS if col not in df.columns]
     if missing_columns:
         logging.error("Missing columns in data: %s", missing_columns)
         raise KeyError(f"Missing columns: {missing_columns}")
 
-    # Compute differences in phases
-    df_processed["dphase1"] = df_processed["V(nphase1)"].diff()
-    df_processed["dphase2"] = df_processed["V(nphase2)"].diff()
-    logging.info(
-        "Computed 'dphase1' and 'dphase2' as differences of V(nphase1) and V(nphase2)."
-    )
+    # Work on the column arrays; the input frame is neither copied nor modified
+    data = {col: df[col].to_numpy() for col in df.columns if col != "time"}
+
+    # Compute differences in phases on the underlying arrays
+    for phase, dphase in (("V(nphase1)", "dphase1"), ("V(nphase2)", "dphase2")):
+        values = data[phase].astype(float, copy=False)
+        diff = np.empty_like(values)
+        diff[:1] = np.nan if previous is None else values[:1] - previous[phase]
+        np.subtract(values[1:], values[:-1], out=diff[1:])
+        data[dphase] = diff
 
     # Compute power
-    df_processed["power"] = df_processed["I(Rrad)"] ** 2
-    logging.info("Computed 'power' as square of 'I(Rrad)'.")
+    data["power"] = np.square(data["I(Rrad)"].astype(float, copy=False))
+
+    # Rows without a finite time fall in no bin, like NaT in resample; the
+    # phase differences above still span them
+    time = df["time"].to_numpy(dtype=float)
+    finite = np.isfinite(time)
+    if not finite.all():
+        logging.warning("Dropping %d row(s) with non-finite time", (~finite).sum())
+        time = time[finite]
+        data = {col: values[finite] for col, values in data.items()}
+
+    return _seconds_to_ns(time), data
+
+
+def _bin_chunk(
+    bins: np.ndarray, data: Dict[str, np.ndarray]
+) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Sum each column and count its non-NaN samples per time bin.
+
+    Returns:
+        Tuple[int, np.ndarray, np.ndarray]: First bin number, and per-bin sums
+        and counts with one row per column.
+    """
+    first = int(bins.min())
+    idx = bins - first
+    n_bins = int(idx.max()) + 1
+    sums = np.empty((len(data), n_bins))
+    counts = np.empty((len(data), n_bins))
+    for row, values in enumerate(data.values()):
+        values = values.astype(float, copy=False)
+        valid = ~np.isnan(values)
+        sums[row] = np.bincount(
+            idx, weights=np.where(valid, values, 0.0), minlength=n_bins
+        )
+        counts[row] = np.bincount(idx, weights=valid, minlength=n_bins)
+    return first, sums, counts
+
+
+def process_data(
+    df: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    resample_interval: str = "100us",
+    drop_empty_bins: bool = False,
+) -> pd.DataFrame:
+    """
+    Process the DataFrame by computing phase differences, power, and resampling.
 
-    # Convert 'time' to datetime
+    Samples are averaged in fixed time bins with np.bincount; bins are aligned
+    to midnight of the first timestamp's day and labelled by their start,
+    matching DataFrame.resample(resample_interval).mean(). Bins without
+    samples are kept as NaN rows unless drop_empty_bins is set, as in
+    time_averaging.process_data.
+
+    The input can also be an iterable of consecutive chunks (see load_data).
+    Each chunk is reduced to per-bin sums and counts, so only the resampled
+    data is held in memory; bins spanning a chunk boundary are merged. Empty
+    chunks are skipped, and input without any rows gives an empty DataFrame
+    with the output columns.
+
+    Parameters:
+        df (Union[pd.DataFrame, Iterable[pd.DataFrame]]): Original DataFrame,
+            or its chunks in time order.
+        resample_interval (str): Resample interval for data (fixed-width
+            pandas offset alias).
+        drop_empty_bins (bool): Omit bins without samples.
+
+    Returns:
+        pd.DataFrame: Processed and resampled DataFrame.
+
+    Raises:
+        KeyError: If required columns are missing.
+        ValueError: If the resample interval is not a fixed-width offset.
+    """
+    chunks = [df] if isinstance(df, pd.DataFrame) else df
     try:
-        df_processed["time"] = pd.to_datetime(df_processed["time"], unit="s")
-        logging.info("Converted 'time' column to datetime.")
-    except (ValueError, TypeError) as e:
-        logging.error("Error converting 'time' to datetime: %s", e)
+        interval = to_offset(resample_interval).nanos
+    except ValueError as e:
+        logging.error("Invalid resample interval %s: %s", resample_interval, e)
         raise
 
-    # Set 'time' as index
-    df_processed.set_index("time", inplace=True)
-    logging.info("Set 'time' as index.")
-
-    # Resample data every 100 microseconds (100U)
+    partials: List[Tuple[int, np.ndarray, np.ndarray]] = []
+    names: List[str] = []
+    origin = None
+    previous = None
     try:
-        df_resampled = df_processed.resample(resample_interval).mean()
-        logging.info("Resampled data every %s and took mean.", resample_interval)
-    except (ValueError, TypeError, KeyError) as e:
+        for chunk in chunks:
+            time_ns, data = _process_chunk(chunk, previous)
+            names = names or list(data)
+            # Empty chunks (e.g. a header-only file) contribute no bins
+            if chunk.empty:
+                continue
+            previous = chunk.iloc[-1]
+            if time_ns.size == 0:
+                continue
+            if origin is None:
+                origin = int(time_ns.min()) // NS_PER_DAY * NS_PER_DAY
+            # Resample data every 100 microseconds (100U)
+            partials.append(_bin_chunk((time_ns - origin) // interval, data))
+    except pd.errors.ParserError as e:
+        # Raised while reading the chunks of a streamed file
+        logging.error("Error parsing input data: %s", e)
+        raise
+    except (ValueError, TypeError) as e:
         logging.error("Error during resampling: %s", e)
         raise
+    logging.info(
+        "Computed 'dphase1', 'dphase2' and 'power' for %d chunk(s).", len(partials)
+    )
 
-    # Reset index
-    df_resampled.reset_index(inplace=True)
-    logging.info("Reset index after resampling.")
+    if not partials:
+        logging.warning("No samples to resample; returning an empty DataFrame.")
+        # Without any chunk, fall back to the columns of a minimal input
+        names = names or REQUIRED_COLUMNS[1:] + ["dphase1", "dphase2", "power"]
+        empty = {name: np.empty(0) for name in names}
+        return pd.DataFrame({"time": pd.DatetimeIndex([], dtype="M8[ns]"), **empty})
+
+    # Merge the partial bins; bins between chunks are left empty (NaN)
+    start = min(first for first, _, _ in partials)
+    end = max(first + sums.shape[1] for first, sums, _ in partials)
+    total = np.zeros((len(names), end - start))
+    count = np.zeros_like(total)
+    for first, sums, counts in partials:
+        total[:, first - start : first - start + sums.shape[1]] += sums
+        count[:, first - start : first - start + counts.shape[1]] += counts
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(total, count, out=total)
+
+    bins = np.arange(start, end)
+    if drop_empty_bins:
+        filled = count.any(axis=0)
+        bins, total = bins[filled], total[:, filled]
+    columns: Dict[str, np.ndarray] = {
+        "time": pd.to_datetime(origin + bins * interval),
+        **dict(zip(names, total)),
+    }
+    df_resampled = pd.DataFrame(columns)
+    logging.info("Resampled data every %s and took mean.", resample_interval)
 
     # Optional: Check 'time' dtype
     logging.debug(
@@ -135,6 +290,26 @@ def process_data(df: pd.DataFrame, resample_interval: str = "100us") -> pd.DataF
     return df_resampled
 
 
+def configure_plotting() -> None:
+    """
+    Configure matplotlib fonts for the phase plots. The rcParams are global,
+    so they are only set on the first call.
+    """
+    global _plotting_configured
+    if _plotting_configured:
+        return
+    plt.rcParams.update(
+        {
+            "font.family": FONT_FAMILY,
+            "mathtext.fontset": MATH_FONTSET,
+            "mathtext.default": MATH_DEFAULT,
+            "font.size": FONT_SIZE,
+        }
+    )
+    _plotting_configured = True
+    logging.info("Configured matplotlib plotting parameters.")
+
+
 def plot_data(
     df_resampled: pd.DataFrame,
     plot_path: Optional[str] = None,
@@ -146,7 +321,8 @@ def plot_data(
 
     Parameters:
         df_resampled (pd.DataFrame): Processed DataFrame.
-        plot_path (Optional[str]): Path to save the plot. If None, plot is not saved.
+        plot_path (Optional[str]): Path to save the plot. If given, the figure
+            is saved and closed instead of shown; if None, it is shown.
         xlim (Optional[tuple[float, float]]): Two-element tuple specifying the x-axis limits, e.g. (xmin, xmax).
         radius (float): Resistance value for power calculation.
 
@@ -164,12 +340,7 @@ def plot_data(
         logging.error("Missing columns for plotting: %s", missing_columns)
         raise KeyError(f"Missing columns: {missing_columns}")
 
-    # Configure plotting parameters
-    plt.rcParams["font.family"] = FONT_FAMILY
-    plt.rcParams["mathtext.fontset"] = MATH_FONTSET
-    plt.rcParams["mathtext.default"] = MATH_DEFAULT
-    plt.rcParams["font.size"] = FONT_SIZE
-    logging.info("Configured matplotlib plotting parameters.")
+    configure_plotting()
 
     # Create figure and axes
     fig, ax1 = plt.subplots(figsize=(10, 6))
@@ -212,30 +383,35 @@ def plot_data(
     # Adjust layout
     fig.tight_layout()
 
-    # Save plot if path is provided
+    # Save and close the plot if a path is provided, otherwise show it
     if plot_path:
         try:
             fig.savefig(plot_path)
             logging.info("Plot saved to %s.", plot_path)
         except OSError as e:
             logging.error("Error saving plot to %s: %s", plot_path, e)
-
-    # Show plot
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
     return fig
 
 
 def save_data(df: pd.DataFrame, file_path: str) -> None:
     """
-    Save the DataFrame to a text file with tab delimiter.
+    Save the DataFrame to a text file with tab delimiter, or to a binary
+    Parquet file if file_path ends in .parquet (requires pyarrow, the
+    "parquet" extra).
 
     Parameters:
         df (pd.DataFrame): DataFrame to save.
         file_path (str): Path to save the DataFrame.
     """
     try:
-        df.to_csv(file_path, sep="\t", index=True)
+        if Path(file_path).suffix == ".parquet":
+            df.to_parquet(file_path, compression="zstd", index=True)
+        else:
+            df.to_csv(file_path, sep="\t", index=True)
         logging.info("Processed data saved to %s.", file_path)
     except OSError as e:
         logging.error("Error saving data to %s: %s", file_path, e)
@@ -271,11 +447,37 @@ def main() -> None:
         help="Resistance value for power calculation",
         default=R_RAD,
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        help="Rows read per chunk while streaming the input file",
+        default=CHUNK_SIZE,
+    )
+    parser.add_argument(
+        "--all-columns",
+        action="store_true",
+        help="Also average the columns not needed for the phase analysis",
+    )
+    parser.add_argument(
+        "--drop-empty-bins",
+        action="store_true",
+        help="Omit resample bins without samples instead of keeping NaN rows",
+    )
     args = parser.parse_args()
 
-    df = load_data(args.input_file)
-    df_resampled = process_data(df, resample_interval=args.resample_interval)
+    usecols = None if args.all_columns else REQUIRED_COLUMNS
+    with load_data(
+        args.input_file, chunksize=args.chunksize, usecols=usecols
+    ) as chunks:
+        df_resampled = process_data(
+            chunks,
+            resample_interval=args.resample_interval,
+            drop_empty_bins=args.drop_empty_bins,
+        )
     save_data(df_resampled, args.output_file)
+    if args.plot_file:
+        # Saving only: render off-screen, without an interactive backend
+        matplotlib.use("Agg")
     plot_data(df_resampled, plot_path=args.plot_file, radius=args.radius)
 
 
@@ -5,11 +5,14 @@ from __future__ import annotations
 import argparse
 import logging
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from matplotlib import gridspec
+from matplotlib.axes import Axes
+from pandas.tseries.frequencies import to_offset
 
 # Constants
 FONT_FAMILY = "Times New Roman"
@@ -18,6 +21,15 @@ MATH_DEFAULT = "it"
 FONT_SIZE = 15
 R_RAD = 8.537  # Resistance value for power calculation
 
+# Set once the matplotlib rcParams above have been applied
+_plotting_configured = False
+
+# Resolution of rasterized scatter points in saved figures
+SAVEFIG_DPI = 150
+
+# Nanoseconds per day, for aligning time bins to midnight like resample
+NS_PER_DAY = 86_400 * 10**9
+
 # Unit conversion factors for power plotting
 UNIT_FACTORS: dict[str, float] = {"W": 1, "mW": 1e3, "uW": 1e6, "nW": 1e9, "pW": 1e12}
 
@@ -29,9 +41,33 @@ def configure_logging(level: int = logging.INFO) -> None:
     logging.basicConfig(level=level, format="%(asctime)s - %(levelname)s - %(message)s")
 
 
+def _load_numeric_table(filename: str) -> Optional[pd.DataFrame]:
+    """
+    Read a whitespace-delimited table whose data rows are all numeric with
+    np.loadtxt, which skips pandas' type inference and NA handling. Returns
+    None if the file does not have that layout (non-numeric fields, ragged
+    rows or duplicate column names), so that the caller can fall back to
+    pd.read_csv.
+    """
+    with open(filename) as f:
+        header = f.readline().split()
+    if not header or len(set(header)) != len(header):
+        return None
+    try:
+        values = np.loadtxt(filename, skiprows=1, ndmin=2)
+    except ValueError:
+        return None
+    if values.shape[1] != len(header):
+        return None
+    return pd.DataFrame(values, columns=header)
+
+
 def load_data(filename: str, delimiter: str = r"\s+") -> pd.DataFrame:
     """
-    Load data from a text file into a Pandas DataFrame.
+    Load data from a text file into a Pandas DataFrame. Files ending in
+    .parquet are read as Parquet (requires pyarrow, the "parquet" extra). Purely
+    numeric whitespace-delimited files are parsed with np.loadtxt, and every
+    column is then float64.
 
     Parameters:
         filename (str): Path to the input text file.
@@ -41,7 +77,13 @@ def load_data(filename: str, delimiter: str = r"\s+") -> pd.DataFrame:
         pd.DataFrame: Loaded DataFrame.
     """
     try:
-        df = pd.read_csv(filename, sep=delimiter)
+        df = None
+        if Path(filename).suffix == ".parquet":
+            df = pd.read_parquet(filename)
+        elif delimiter == r"\s+":
+            df = _load_numeric_table(filename)
+        if df is None:
+            df = pd.read_csv(filename, sep=delimiter)
         logging.info("Data loaded from %s", filename)
         return df
     except Exception:
@@ -63,30 +105,74 @@ def rename_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df.rename(columns=rename_map)
 
 
+def _time_to_ns(t: np.ndarray, unit: str) -> np.ndarray:
+    """
+    Convert float times in the given unit to integer nanoseconds, rounding the
+    fractional part the same way as pd.to_datetime(t, unit=unit).
+    """
+    ns_per_unit = pd.Timedelta(1, unit=unit).value
+    base = t.astype(np.int64)
+    frac = t - base
+    if ns_per_unit > 1:
+        frac = np.round(frac, len(str(ns_per_unit)) - 1)
+    return base * ns_per_unit + (frac * ns_per_unit).astype(np.int64)
+
+
+def _shrink_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast float64 columns other than 'time' to float32. The time column
+    keeps float64 so that bin edges stay exact at nanosecond resolution.
+    """
+    float_columns = {
+        col: np.float32
+        for col in df.columns
+        if col != "time" and df[col].dtype == np.float64
+    }
+    logging.info("Downcast %d column(s) to float32", len(float_columns))
+    return df.astype(float_columns)
+
+
 def process_data(
     df: pd.DataFrame,
     time_unit: str = "us",
     resample_freq: str = "1N",
     skip_resampling: bool = False,
+    drop_empty_bins: bool = True,
 ) -> pd.DataFrame:
     """
-    Process the DataFrame by calculating power and resampling on the time index.
+    Process the DataFrame by calculating power and averaging it over time bins.
+    The input DataFrame is not modified.
+
+    Samples are grouped by integer division of their time in nanoseconds,
+    with bins aligned to midnight of the first timestamp like resample's
+    default origin. By default only bins that contain samples are returned;
+    with drop_empty_bins=False the empty bins in between are kept as NaN
+    rows, like resample (and phase_analysis.process_data). Rows with a
+    non-finite time are dropped, and an input without samples gives an empty
+    DataFrame with the output columns.
 
     Parameters:
         df (pd.DataFrame): Original DataFrame.
         time_unit (str): Unit for time conversion (e.g. 's', 'us').
-        resample_freq (str): Pandas offset alias for resampling frequency.
+        resample_freq (str): Fixed-width pandas offset alias for the bin width.
         skip_resampling (bool): Skip time conversion and resampling.
+        drop_empty_bins (bool): Omit bins without samples.
 
     Returns:
         pd.DataFrame: Processed DataFrame with power and resampled time.
     """
-    df_copy = df.copy()
+    # New columns are added with assign, which returns a new frame sharing
+    # the input's column data instead of a copy
+    df_processed = df
     # Calculate power if not present
-    if "power" not in df_copy.columns and "I(Rrad)" in df_copy.columns:
-        df_copy["power"] = df_copy["I(Rrad)"] ** 2 * R_RAD
+    if "power" not in df.columns and "I(Rrad)" in df.columns:
+        # Square and scale on the column array, with a single allocation
+        current = df["I(Rrad)"].to_numpy()
+        power = np.square(current, dtype=np.result_type(current, np.float32))
+        power *= R_RAD
+        df_processed = df_processed.assign(power=power)
         logging.info("Calculated 'power' from I(Rrad)")
-    elif "power" in df_copy.columns:
+    elif "power" in df.columns:
         logging.info("'power' column already exists; skipping calculation")
     else:
         logging.warning("No 'I(Rrad)' column found; skipping power calculation")
@@ -94,12 +180,36 @@ def process_data(
     # Handle time conversion and resampling
     if skip_resampling:
         logging.info("Skipping time conversion and resampling as requested")
-    elif "time" in df_copy.columns:
+    elif "time" in df.columns:
         try:
-            df_copy["time"] = pd.to_datetime(df_copy["time"], unit=time_unit)
-            df_copy.set_index("time", inplace=True)
-            df_copy = df_copy.resample(resample_freq).mean()
-            df_copy.reset_index(inplace=True)
+            freq_ns = to_offset(resample_freq).nanos
+            time = df["time"].to_numpy(dtype=float)
+            # Rows without a finite time fall in no bin, like NaT in resample
+            finite = np.isfinite(time)
+            if not finite.all():
+                logging.warning(
+                    "Dropping %d row(s) with non-finite time", (~finite).sum()
+                )
+                df_processed, time = df_processed[finite], time[finite]
+            df_processed = df_processed.drop(columns="time")
+            if time.size == 0:
+                logging.warning("No samples to resample")
+                df_processed = df_processed.reset_index(drop=True)
+                df_processed.insert(0, "time", pd.DatetimeIndex([], dtype="M8[ns]"))
+                return df_processed
+            time_ns = _time_to_ns(time, time_unit)
+            origin = int(time_ns.min()) // NS_PER_DAY * NS_PER_DAY
+            bins = (time_ns - origin) // freq_ns
+            # Cython groupby mean on the bin numbers, without a DatetimeIndex
+            df_processed = df_processed.groupby(bins).mean()
+            if not drop_empty_bins:
+                df_processed = df_processed.reindex(
+                    np.arange(bins.min(), bins.max() + 1)
+                )
+            df_processed.insert(
+                0, "time", pd.to_datetime(origin + df_processed.index * freq_ns)
+            )
+            df_processed.reset_index(drop=True, inplace=True)
             logging.info("Resampled data every %s", resample_freq)
         except Exception:
             logging.exception("Failed processing 'time' column")
@@ -109,17 +219,72 @@ def process_data(
             "No 'time' column found; skipping time conversion and resampling"
         )
 
-    return df_copy
+    return df_processed
 
 
 def configure_plotting() -> None:
     """
-    Set global matplotlib plotting parameters.
+    Set global matplotlib plotting parameters. The rcParams are global, so
+    they are only set on the first call.
+    """
+    global _plotting_configured
+    if _plotting_configured:
+        return
+    plt.rcParams.update(
+        {
+            "font.family": FONT_FAMILY,
+            "mathtext.fontset": MATH_FONTSET,
+            "mathtext.default": MATH_DEFAULT,
+            "font.size": FONT_SIZE,
+        }
+    )
+    _plotting_configured = True
+
+
+def _color_groups(
+    c: np.ndarray, cmap: str = "jet"
+) -> List[Tuple[np.ndarray, Tuple[float, float, float, float]]]:
+    """
+    Group the points by the colormap entry ax.scatter(c=c) would give them
+    with a linear norm over the data range. Points with non-finite c are left
+    out, as scatter leaves them unpainted.
+
+    Returns:
+        List[Tuple[np.ndarray, Tuple[float, float, float, float]]]: Indices of
+        the points in each group and the group's RGBA color, in color order.
+    """
+    colormap = plt.get_cmap(cmap)
+    valid = np.flatnonzero(np.isfinite(c))
+    c = c[valid]
+    if c.size == 0:
+        return []
+
+    # Same lookup-table index as Colormap.__call__ on the normalized values
+    c_min, c_max = c.min(), c.max()
+    scaled = (c - c_min) / (c_max - c_min) if c_max > c_min else np.zeros_like(c)
+    index = np.minimum((scaled * colormap.N).astype(int), colormap.N - 1)
+
+    order = np.argsort(index, kind="stable")
+    splits = np.flatnonzero(np.diff(index[order])) + 1
+    return [
+        (valid[group], colormap(index[group[0]])) for group in np.split(order, splits)
+    ]
+
+
+def _scatter_by_color(
+    ax: Axes,
+    x: np.ndarray,
+    y: np.ndarray,
+    groups: List[Tuple[np.ndarray, Tuple[float, float, float, float]]],
+) -> None:
     """
-    plt.rcParams["font.family"] = FONT_FAMILY
-    plt.rcParams["mathtext.fontset"] = MATH_FONTSET
-    plt.rcParams["mathtext.default"] = MATH_DEFAULT
-    plt.rcParams["font.size"] = FONT_SIZE
+    Scatter points with one single-color scatter per color group, so that
+    matplotlib draws each group with its fast uniform-marker path instead of
+    coloring every point. Groups are drawn in color order rather than data
+    order.
+    """
+    for points, color in groups:
+        ax.scatter(x[points], y[points], s=5, color=color, rasterized=True)
 
 
 def plot_dc_sweep(
@@ -156,24 +321,28 @@ def plot_dc_sweep(
     ax_side = fig.add_subplot(spec[3])
     ax_body = fig.add_subplot(spec[2], sharex=ax_top, sharey=ax_side)
 
-    delta_v = df["V(nt)"] - df["V(na)"]
-    power_scaled = df["power"] * R_RAD * UNIT_FACTORS[output_unit]
-    current_scaled = df["I(Rgnd)"] * 1e3  # mA
+    # Scale the column arrays directly, folding the constants into one factor
+    power = df["power"].to_numpy(dtype=float)
+    delta_v = df["V(nt)"].to_numpy(dtype=float) - df["V(na)"].to_numpy(dtype=float)
+    power_scaled = power * (R_RAD * UNIT_FACTORS[output_unit])
+    current_scaled = df["I(Rgnd)"].to_numpy(dtype=float) * 1e3  # mA
+    # Color all three panels from one grouping of the points by power
+    groups = _color_groups(power)
 
     ax_top.grid(ls="--")
-    ax_top.scatter(delta_v, power_scaled, s=5, c=df["power"], cmap="jet")
+    _scatter_by_color(ax_top, delta_v, power_scaled, groups)
     ax_top.set_xlim(xlim)
     ax_top.set_ylabel(f"Power [{output_unit}]")
     ax_top.yaxis.set_label_coords(-0.1, 0.5)
 
     ax_side.grid(ls="--")
-    ax_side.scatter(power_scaled, current_scaled, s=5, c=df["power"], cmap="jet")
+    _scatter_by_color(ax_side, power_scaled, current_scaled, groups)
     if ylim:
         ax_side.set_ylim(ylim)
     ax_side.set_xlabel(f"Power [{output_unit}]")
 
     ax_body.grid(ls="--")
-    ax_body.scatter(delta_v, current_scaled, s=5, c=df["power"], cmap="jet")
+    _scatter_by_color(ax_body, delta_v, current_scaled, groups)
     ax_body.set_xlabel("Voltage [V]")
     ax_body.set_ylabel("Current [mA]")
     ax_body.set_xticks([0, 0.25, 0.5, 0.75, 1, 1.25])
@@ -190,7 +359,7 @@ def plot_dc_sweep(
 
     if output_path:
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(output_path)
+        fig.savefig(output_path, dpi=SAVEFIG_DPI)
         logging.info("DC sweep plot saved to %s", output_path)
     plt.show()
 
@@ -229,11 +398,15 @@ def plot_temperature_time(df: pd.DataFrame, output_path: Optional[str] = None) -
 
 def save_data(df: pd.DataFrame, output_file: str) -> None:
     """
-    Save DataFrame to file with tab delimiter.
+    Save DataFrame to file with tab delimiter, or to a binary Parquet file if
+    output_file ends in .parquet (requires pyarrow, the "parquet" extra).
     """
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(output_path, sep="\t", index=True)
+    if output_path.suffix == ".parquet":
+        df.to_parquet(output_path, compression="zstd", index=True)
+    else:
+        df.to_csv(output_path, sep="\t", index=True)
     logging.info("Data saved to %s", output_file)
 
 
@@ -244,6 +417,13 @@ def main() -> None:
     parser.add_argument(
         "--output_file", help="Processed data output path", default=None
     )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        help="Format of the default processed data file (without --output_file); "
+        "parquet requires pyarrow",
+        default="csv",
+    )
     parser.add_argument("--plot_path", help="DC sweep plot file path", default=None)
     parser.add_argument(
         "--tt_plot_path", help="Temperature-time plot file path", default=None
@@ -270,20 +450,35 @@ def main() -> None:
         action="store_true",
         help="Skip time conversion and resampling for already resampled data",
     )
+    parser.add_argument(
+        "--keep_empty_bins",
+        action="store_true",
+        help="Keep bins without samples as NaN rows, like pandas resample",
+    )
+    parser.add_argument(
+        "--float32",
+        action="store_true",
+        help="Downcast data columns to float32 to halve memory use",
+    )
     args = parser.parse_args()
 
     df = load_data(args.input_file, delimiter=args.delimiter)
     df = rename_columns(df)
+    if args.float32:
+        df = _shrink_dtypes(df)
     df_processed = process_data(
         df,
         time_unit=args.time_unit,
         resample_freq=args.resample_freq,
         skip_resampling=args.skip_resample,
+        drop_empty_bins=not args.keep_empty_bins,
     )
 
     if not args.skip_resample:
+        input_path = Path(args.input_file)
+        suffix = ".parquet" if args.format == "parquet" else ".txt"
         output_data_path = args.output_file or str(
-            Path(args.input_file).with_suffix("_processed.txt")
+            input_path.with_name(f"{input_path.stem}_processed{suffix}")
         )
         save_data(df_processed, output_data_path)
     else:
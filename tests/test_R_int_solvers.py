@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import numpy as np
+
+from fitting.R_int import solvers
+from fitting.R_int.solvers import I_int2V_int, solve_T
+
+# Initial parameters of fitting/R_int/main.py
+PARAMS = dict(
+    A=140.26315944091203,
+    B=74.42877017162486,
+    C=2993.7109475835937,
+    D=14.966433685735403,
+    beta=0.07007291353077101,
+    gamma=7162.304320037531,
+    T_bath=-26.29469185418874,
+)
+
+
+def test_solve_T_stays_above_R_th_pole() -> None:
+    """
+    The temperature solve must not cross the pole at ln(alpha) / beta onto a
+    root with negative thermal resistance.
+    """
+    beta, gamma, T_bath = PARAMS["beta"], PARAMS["gamma"], PARAMS["T_bath"]
+    for alpha in (0.5, 1.0, 1.1):
+        I_int = np.array([-2.34e-3, -2.13e-3, 2.13e-3, 2.34e-3])
+        # Solve from the bracket, not the previous alpha's warm start
+        solvers._last_solution = None
+        V_int = I_int2V_int(I_int, alpha=alpha, **PARAMS)
+        assert np.all(np.isfinite(V_int))
+        T = solve_T(V_int * I_int, alpha, beta, gamma, T_bath)
+        assert np.all(T > np.log(alpha) / beta)
+        assert np.all(1 - alpha * np.exp(-beta * T) > 0)
+        R_th = gamma / (1 - alpha * np.exp(-beta * T))
+        np.testing.assert_allclose(T, R_th * V_int * I_int + T_bath, rtol=1e-10)
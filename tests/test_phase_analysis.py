@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import numpy as np
+import pandas as pd
+
+from post_processing.phase_analysis import process_data
+
+
+def test_process_data_drops_nan_time() -> None:
+    """
+    Rows with a NaN time fall in no bin, whole or streamed in chunks, while
+    the phase differences still span them.
+    """
+    df = pd.DataFrame(
+        {
+            "time": [0.0, 1e-4, np.nan, 2e-4, 3e-4],
+            "V(nphase1)": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "V(nphase2)": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "I(Rrad)": [1.0, 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+    result = process_data(df)
+    np.testing.assert_array_equal(result["V(nphase1)"], [1.0, 2.0, 4.0, 5.0])
+    np.testing.assert_array_equal(result["dphase1"], [np.nan, 1.0, 1.0, 1.0])
+    chunked = process_data([df.iloc[:2], df.iloc[2:3], df.iloc[3:]])
+    pd.testing.assert_frame_equal(chunked, result)
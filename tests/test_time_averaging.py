@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+# coding: utf-8
+
+import numpy as np
+import pandas as pd
+
+from post_processing.time_averaging import process_data
+
+
+def test_process_data_empty_frame() -> None:
+    """
+    An input without rows gives an empty frame with the output columns.
+    """
+    df = pd.DataFrame({"time": np.empty(0), "I(Rrad)": np.empty(0)})
+    result = process_data(df, time_unit="us", resample_freq="1us")
+    assert list(result.columns) == ["time", "I(Rrad)", "power"]
+    assert len(result) == 0
+    assert result["time"].dtype == "datetime64[ns]"
+
+
+def test_process_data_drops_nan_time() -> None:
+    """
+    Rows with a NaN time are dropped before binning, like NaT in resample.
+    """
+    df = pd.DataFrame(
+        {"time": [0.0, 1.0, np.nan, 2.0, 3.0], "I(Rrad)": [1.0, 2.0, 3.0, 4.0, 5.0]}
+    )
+    result = process_data(df, time_unit="us", resample_freq="1us")
+    np.testing.assert_array_equal(result["I(Rrad)"], [1.0, 2.0, 4.0, 5.0])
+    np.testing.assert_array_equal(
+        result["time"], pd.to_datetime([0, 1, 2, 3], unit="us")
+    )